@@ -7,6 +7,17 @@ of the Python programming language. It's intended as a reference or sampler,
 not necessarily as a model for structuring a real-world application.
 """
 
+import logging
+from array import array
+from functools import lru_cache, partial, wraps
+from operator import itemgetter, mul
+
+# Debug messages are off by default; enable with logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# Section separator printed between sections
+SEP = "-" * 20
+
 # --- 1. Basic Syntax & Variables ---
 # This is a single-line comment
 
@@ -26,12 +37,13 @@ boolean_var: bool = True      # Boolean
 none_var = None              # NoneType (representing absence of value)
 
 # You can print variables and their types
-print(f"Integer: {integer_var} (Type: {type(integer_var)})")
-print(f"Float: {float_var} (Type: {type(float_var)})")
-print(f"String: {string_var} (Type: {type(string_var)})")
-print(f"Boolean: {boolean_var} (Type: {type(boolean_var)})")
-print(f"None: {none_var} (Type: {type(none_var)})")
-print("-" * 20)
+# type(x).__name__ gives just the name, e.g. "int" rather than "<class 'int'>"
+print(f"Integer: {integer_var} (Type: {type(integer_var).__name__})")
+print(f"Float: {float_var} (Type: {type(float_var).__name__})")
+print(f"String: {string_var} (Type: {type(string_var).__name__})")
+print(f"Boolean: {boolean_var} (Type: {type(boolean_var).__name__})")
+print(f"None: {none_var} (Type: {type(none_var).__name__})")
+print(SEP)
 
 # --- 2. Operators ---
 print("--- 2. Operators ---")
@@ -71,11 +83,20 @@ list3 = list1
 print(f"list1 is list2: {list1 is list2}") # False (different objects)
 print(f"list1 == list2: {list1 == list2}") # True (same content)
 print(f"list1 is list3: {list1 is list3}") # True (same object)
+# Interning: an interning table hands back one shared tuple per distinct value.
+# Each lookup still hashes and compares once, but afterwards two interned
+# values are equal exactly when they are the same object, so `is` suffices.
+interned: dict[tuple[int, ...], tuple[int, ...]] = {}
+key1 = tuple(list1)
+key2 = tuple(list2)
+canonical1 = interned.setdefault(key1, key1)
+canonical2 = interned.setdefault(key2, key2) # Returns the tuple stored for key1
+print(f"interned tuple(list1) is interned tuple(list2): {canonical1 is canonical2}") # True (shared object)
 
 # Membership Operators (in, not in)
 print(f"1 in list1: {1 in list1}")
 print(f"3 not in list1: {3 not in list1}")
-print("-" * 20)
+print(SEP)
 
 
 # --- 3. Data Structures ---
@@ -96,13 +117,17 @@ print(f"Tuple: {my_tuple}")
 print(f"Tuple element at index 1: {my_tuple[1]}")
 # my_tuple[0] = 5 # This would cause a TypeError
 
-# Sets (mutable, unordered collection of unique elements)
-my_set: set[int] = {1, 2, 3, 4, 4, 5} # Duplicates are ignored
-print(f"Set: {my_set}")
-my_set.add(6)
-print(f"Set after add(6): {my_set}")
+# Frozensets (immutable, unordered collection of unique elements)
+# Prefer these for sets that are built once and only queried
+my_set: frozenset[int] = frozenset((1, 2, 3, 4, 4, 5)) # Duplicates are ignored
+print(f"Frozenset: {my_set}")
 print(f"Is 3 in set? {3 in my_set}")
 
+# Sets (mutable, unordered collection of unique elements)
+mutable_set: set[int] = set(my_set)
+mutable_set.add(6)
+print(f"Set after add(6): {mutable_set}")
+
 # Dictionaries (mutable, unordered collection of key-value pairs)
 my_dict: dict[str, int | str] = {"name": "Alice", "age": 30, "city": "New York"}
 print(f"Dictionary: {my_dict}")
@@ -113,7 +138,7 @@ print(f"Updated Dictionary: {my_dict}")
 print(f"Dictionary keys: {my_dict.keys()}")
 print(f"Dictionary values: {my_dict.values()}")
 print(f"Dictionary items: {my_dict.items()}")
-print("-" * 20)
+print(SEP)
 
 # --- 4. Control Flow ---
 print("--- 4. Control Flow ---")
@@ -164,7 +189,7 @@ if temperature > 100:
 else:
     print("Temperature is not extreme.")
 
-print("-" * 20)
+print(SEP)
 
 # --- 5. Functions ---
 print("--- 5. Functions ---")
@@ -174,7 +199,10 @@ def greet(name: str) -> str:
     """This function greets the person passed in as a parameter."""
     return f"Hello, {name}!"
 
-message = greet("Bob")
+# functools.partial pre-binds arguments; shown here as a demonstration of the
+# pattern, which pays off when the same arguments are passed on many calls
+greet_bob = partial(greet, "Bob")
+message = greet_bob()
 print(message)
 print(f"Docstring of greet function: {greet.__doc__}")
 
@@ -214,23 +242,35 @@ scope_test()
 print(f"Outside function: {global_var}")
 # print(local_var) # This would cause a NameError because local_var is local to the function
 
-print("-" * 20)
+print(SEP)
 
 # --- 6. Recursion ---
 print("--- 6. Recursion ---")
 
+def _factorial(n: int) -> int:
+    """Recursive kernel; only called from factorial() after validation."""
+    if n == 0 or n == 1:
+        return 1 # Base case
+    else:
+        # Recursive step; taking two factors per call halves the recursion depth,
+        # leaving room for the factorial() and cache wrappers on the stack
+        return n * (n - 1) * _factorial(n - 2)
+
+# Memoize the public, validated entry point: repeating a call with the same n
+# is a single cache lookup. The recursive kernel stays unwrapped, so the cache
+# adds one call in total rather than one per recursion level.
+@lru_cache(maxsize=None)
 def factorial(n: int) -> int:
     """Calculates factorial recursively."""
+    # Validate once here so the recursive kernel doesn't repeat the check per call
     if not isinstance(n, int) or n < 0:
         raise ValueError("Factorial requires a non-negative integer")
-    if n == 0 or n == 1:
-        return 1 # Base case
-    else:
-        return n * factorial(n - 1) # Recursive step
+    return _factorial(n)
 
 print(f"Factorial of 5: {factorial(5)}")
+print(f"Factorial of 5 again: {factorial(5)}") # Served from the cache
 # print(f"Factorial of -1: {factorial(-1)}") # This would raise the ValueError
-print("-" * 20)
+print(SEP)
 
 # --- 7. Object-Oriented Programming (OOP) ---
 print("--- 7. Object-Oriented Programming (OOP) ---")
@@ -240,12 +280,17 @@ class Animal:
     # Class attribute (shared by all instances)
     classification = "Unknown"
 
+    # __slots__ replaces the per-instance __dict__ with fixed attribute slots
+    # ("__species" is name-mangled to "_Animal__species" just like the attribute)
+    __slots__ = ("_name", "__species")
+
     # Constructor (__init__ method)
     def __init__(self, name: str, species: str):
         # Instance attributes (specific to each instance)
         self._name = name # Convention: _ prefix suggests protected (internal use)
         self.__species = species # Convention: __ prefix triggers name mangling (more private)
-        print(f"Animal '{self._name}' ({self.__species}) created.")
+        # Lazy %-style args: nothing is formatted unless DEBUG logging is enabled
+        logger.debug("Animal '%s' (%s) created.", self._name, self.__species)
 
     # Instance method
     def speak(self) -> str:
@@ -274,11 +319,14 @@ class Dog(Animal):
     # Override class attribute
     classification = "Mammal"
 
+    # Only the new attribute; the base class slots are inherited
+    __slots__ = ("_breed",)
+
     def __init__(self, name: str, breed: str):
         # Call the base class constructor
         super().__init__(name, species="Dog")
         self._breed = breed # Add specific attribute for Dog
-        print(f"Dog '{self._name}' of breed '{self._breed}' created.")
+        logger.debug("Dog '%s' of breed '%s' created.", self._name, self._breed)
 
     # Override the speak method (Polymorphism)
     def speak(self) -> str:
@@ -315,7 +363,7 @@ print(f"Animal classification: {Animal.get_classification()}")
 print(f"Dog classification: {Dog.get_classification()}")       # Uses overridden class attribute
 print(f"Instance Dog classification: {my_dog.get_classification()}")
 
-print("-" * 20)
+print(SEP)
 
 # --- 8. Error Handling ---
 print("--- 8. Error Handling ---")
@@ -352,7 +400,7 @@ try:
 except ValueError as e:
     print(f"Caught expected error: {e}")
 
-print("-" * 20)
+print(SEP)
 
 # --- 9. Modules and Imports ---
 print("--- 9. Modules and Imports ---")
@@ -361,6 +409,8 @@ print("--- 9. Modules and Imports ---")
 import math
 print(f"Square root of 16: {math.sqrt(16)}")
 print(f"Value of pi: {math.pi}")
+# C implementations like math.factorial avoid one Python frame per step
+print(f"math.factorial(5): {math.factorial(5)}")
 
 # Import specific items from a module
 from random import choice, randint
@@ -373,7 +423,7 @@ import datetime as dt
 now = dt.datetime.now()
 print(f"Current date and time: {now}")
 
-print("-" * 20)
+print(SEP)
 
 # --- 10. File I/O ---
 print("--- 10. File I/O ---")
@@ -391,13 +441,12 @@ try:
     # Reading from a file
     print(f"Reading from {file_path}:")
     with open(file_path, "r", encoding="utf-8") as f:
-        # Read entire file content
-        # content = f.read()
-        # print(content)
+        # Read entire file content in one call
+        content = f.read()
 
-        # Or read line by line
-        for line in f:
-            print(f"  - {line.strip()}") # strip() removes leading/trailing whitespace/newline
+    # Or iterate line by line (for line in f: ...), which reads and prints per line;
+    # for small files, one read and one write is cheaper
+    print("\n".join(f"  - {line.strip()}" for line in content.splitlines()))
 
 except IOError as e:
     print(f"An error occurred during file I/O: {e}")
@@ -405,11 +454,15 @@ finally:
     # Clean up the created file (optional, for demo purposes)
     import os
     if os.path.exists(file_path):
-        # os.remove(file_path)
+        # To delete it instead, call os.remove directly and catch the missing-file
+        # case (EAFP); that skips the separate exists() check and its race:
+        #     try:
+        #         os.remove(file_path)
+        #     except FileNotFoundError:
+        #         pass
         print(f"(Keeping {file_path} for inspection)")
-        pass # Comment out os.remove if you want to inspect the file
 
-print("-" * 20)
+print(SEP)
 
 
 # --- 11. List Comprehensions & Generator Expressions ---
@@ -421,11 +474,12 @@ squares = [n**2 for n in numbers]
 print(f"Original numbers: {numbers}")
 print(f"Squares (list comprehension): {squares}")
 
-even_squares = [n**2 for n in numbers if n % 2 == 0]
+# Reuse the squares computed above instead of squaring each number again
+even_squares = [sq for n, sq in zip(numbers, squares) if n % 2 == 0]
 print(f"Even squares only: {even_squares}")
 
 # Dictionary comprehension
-square_dict = {n: n**2 for n in numbers}
+square_dict = {n: sq for n, sq in zip(numbers, squares)}
 print(f"Number-square dictionary: {square_dict}")
 
 # Set comprehension
@@ -441,7 +495,11 @@ for sq in squares_gen:
     print(f"  - Generated square: {sq}")
 # Note: A generator can only be iterated over once. Trying again will yield nothing.
 
-print("-" * 20)
+# array('q') stores the same values packed as 64-bit ints instead of a list of int objects
+packed_numbers = array('q', numbers)
+print(f"Packed array of numbers: {packed_numbers}")
+
+print(SEP)
 
 
 # --- 12. Lambdas (Anonymous Functions) ---
@@ -458,10 +516,21 @@ nums = [1, 2, 3, 4, 5, 6]
 doubled_nums = list(map(lambda x: x * 2, nums))
 print(f"Doubled numbers (using map+lambda): {doubled_nums}")
 
+# The lambda runs as a Python function call per element; partial(mul, 2) is a
+# C-level callable giving the same result without that per-element frame.
+# Collecting into array('q') stores packed ints rather than a list of int objects.
+doubled_packed = array('q', map(partial(mul, 2), nums))
+print(f"Doubled numbers (using map+partial): {doubled_packed.tolist()}")
+
 # Filter: Filter items based on a function that returns True/False
 even_nums = list(filter(lambda x: x % 2 == 0, nums))
 print(f"Even numbers (using filter+lambda): {even_nums}")
 
+# A list comprehension runs the test inline in a single frame instead of
+# calling the lambda once per element
+even_comprehension = [x for x in nums if x % 2 == 0]
+print(f"Even numbers (using a comprehension): {even_comprehension}")
+
 # Sorting a list of dictionaries using a lambda for the key
 people = [
     {'name': 'Charlie', 'age': 35},
@@ -469,9 +538,13 @@ people = [
     {'name': 'Bob', 'age': 40}
 ]
 people.sort(key=lambda person: person['age'])
-print(f"People sorted by age: {people}")
+print(f"People sorted by age (lambda key): {people}")
+
+# operator.itemgetter('age') builds the same key function in C
+people_by_age = sorted(people, key=itemgetter('age'))
+print(f"People sorted by age (itemgetter key): {people_by_age}")
 
-print("-" * 20)
+print(SEP)
 
 # --- 13. Decorators ---
 print("--- 13. Decorators ---")
@@ -480,6 +553,7 @@ print("--- 13. Decorators ---")
 # its behavior without explicitly modifying it.
 
 def my_decorator(func):
+    @wraps(func) # Copies __name__, __doc__, etc. from func onto wrapper
     def wrapper(*args, **kwargs):
         print("Something is happening before the function is called.")
         result = func(*args, **kwargs) # Call the original function
@@ -496,6 +570,7 @@ def say_whee(name: str):
 # Call the decorated function
 return_val = say_whee("Decorators")
 print(f"Return value from decorated function: {return_val}")
+print(f"Decorated function keeps its name: {say_whee.__name__}")
 
 # Equivalent non-decorator syntax (for understanding):
 # def say_hello_again():
@@ -503,7 +578,7 @@ print(f"Return value from decorated function: {return_val}")
 # say_hello_again = my_decorator(say_hello_again) # Manually wrap it
 # say_hello_again()
 
-print("-" * 20)
+print(SEP)
 
 # --- 14. Type Hinting (already used throughout) ---
 print("--- 14. Type Hinting ---")
@@ -518,7 +593,7 @@ def hinted_function(param1: int, param2: str) -> bool:
 result_bool: bool = hinted_function(5, "Example")
 print(f"Hinted function returned: {result_bool}")
 
-print("-" * 20)
+print(SEP)
 
 # --- End of Comprehensive Overview ---
 print("--- End of Comprehensive Python Overview ---")